@@ -11,13 +11,485 @@ Version: 1.0.0
 License: MIT
 """
 
+import asyncio
+import ctypes
+import functools
+import glob
+import inspect
 import psutil
+import queue
 import subprocess
+import sys
 import json
+import os
+import platform
+import re
+import select
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upper bound on smartctl processes running at once
+MAX_SMART_WORKERS = 8
+
+# smartctl gets a short first attempt; only drives that time out are retried
+# with the longer limit
+SMART_TIMEOUT_FAST = 5
+SMART_TIMEOUT_SLOW = 20
+
+# Seconds the mount table is reused between scans unless it changes
+MOUNTS_TTL_SECONDS = 60
+
+# Alerts queued within this many seconds of each other go out as one email
+MAIL_DEBOUNCE_SECONDS = 30
+
+# Seconds a SMART reading stays fresh; matches smartd's default polling interval
+CACHE_TTL_SECONDS = 1800
+
+# Drives moving more than BUSY_THRESHOLD_BYTES within BUSY_SAMPLE_SECONDS are
+# considered busy and their SMART poll is deferred
+BUSY_SAMPLE_SECONDS = 0.2
+BUSY_THRESHOLD_BYTES = 4 << 20
+
+# Upper bound for the per-drive SMART back-off interval
+MAX_BACKOFF_SECONDS = 3600
+
+# Windows drive letter -> legacy /dev/sdX name, used only when smartctl
+# cannot enumerate physical drives itself
+_WIN_TO_DEV = {chr(c): f"/dev/sd{chr(c - ord('A') + ord('a'))}" for c in range(ord('A'), ord('Z') + 1)}
+
+# Bytes per GiB
+_GIB = 1 << 30
+
+# SMART results keyed by drive path, smartctl device type and detail level:
+# {(drive_path, device_type, full): (smart_data, fetched_at)}
+_cache = {}
+
+# Finds the overall health verdict without decoding the whole smartctl document
+_PASSED_RE = re.compile(r'"smart_status"\s*:\s*\{[^{}]*"passed"\s*:\s*(true|false)')
+
+# smartctl's report for a drive left asleep by '-n standby' (exit status 2)
+_STANDBY_RE = re.compile(r'is in (STANDBY|SLEEP) mode')
+
+# Sensor chips that belong to storage devices
+_DRIVE_RE = re.compile(r'nvme|ssd|sata|drive', re.I)
+
+# Linux hardware-monitoring sysfs class
+_HWMON_ROOT = '/sys/class/hwmon'
+
+def _discover_hwmon_sensors():
+    """
+    Find drive temperature inputs under /sys/class/hwmon.
+    
+    Returns:
+        list: (sensor_name, label, temp_input_path) tuples for chips whose
+            name matches _DRIVE_RE; empty where hwmon is unavailable
+    """
+    sensors = []
+    for name_path in sorted(glob.glob(os.path.join(_HWMON_ROOT, 'hwmon*', 'name'))):
+        try:
+            with open(name_path) as f:
+                sensor_name = f.read().strip()
+        except OSError:
+            continue
+        
+        if not _DRIVE_RE.search(sensor_name):
+            continue
+        
+        for input_path in sorted(glob.glob(os.path.join(os.path.dirname(name_path), 'temp*_input'))):
+            try:
+                with open(input_path[:-len('input')] + 'label') as f:
+                    label = f.read().strip()
+            except OSError:
+                label = ''
+            sensors.append((sensor_name, label, input_path))
+    
+    return sensors
+
+# Progress messages printed per partition, sensor and drive in verbose mode
+_MSG_PARTITION_OK = "✅ {}: {:.1f}% used ({} GB free)"
+_MSG_SENSOR_OK = "✅ {}: {}°C"
+_MSG_SMART_CHECKING = "\n🔧 Checking SMART data for {}..."
+_MSG_SMART_PASSED = "✅ {}: SMART status PASSED"
+
+# Alert message templates; alerts are stored as (template_id, *args) tuples
+# and only rendered when shown or sent
+_TEMPLATES = {
+    'disk_usage': "⚠️  {} is {:.1f}% full (threshold: {}%)",
+    'temperature': "🔥 {} temperature: {}°C (threshold: {}°C)",
+    'smart_failed': "❌ {}: SMART status FAILED - Drive may be failing!",
+}
+
+def _format_alert(alert):
+    """
+    Render an alert tuple as a human-readable message.
+    
+    Args:
+        alert (tuple): (template_id, *args) as stored in ``alerts``
+        
+    Returns:
+        str: Formatted alert message
+    """
+    return _TEMPLATES[alert[0]].format(*alert[1:])
+
+def _alert_record(alert):
+    """
+    Describe an alert tuple as a self-contained dict for the JSON log.
+    
+    Args:
+        alert (tuple): (template_id, device, [value, threshold])
+        
+    Returns:
+        dict: 'type', 'device', 'message' and, for threshold alerts,
+            'value' and 'threshold'
+    """
+    record = {'type': alert[0], 'device': alert[1]}
+    if len(alert) > 2:
+        record['value'] = round(alert[2], 1)
+        record['threshold'] = alert[3]
+    record['message'] = _format_alert(alert)
+    return record
+
+def _close_smtp(server):
+    """
+    Close an SMTP connection, ignoring errors from an already dead one.
+    
+    Args:
+        server (smtplib.SMTP): Connection to close, or None
+        
+    Returns:
+        None: So callers can write ``server = _close_smtp(server)``
+    """
+    if server is not None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    return None
+
+# orjson decodes and encodes considerably faster when installed
+_json_loads = orjson.loads if orjson else json.loads
+
+def _json_dumps(obj):
+    """
+    Serialize an object to indented UTF-8 JSON.
+    
+    Args:
+        obj: JSON-compatible object
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _write_results(results, f):
+    """
+    Stream health check results to a binary file as indented JSON.
+    
+    Each top-level value, and each drive's SMART data, is encoded and
+    written separately, so the whole document never exists as one string.
+    
+    Args:
+        results (dict): Results from run_full_check()
+        f: File object opened in binary write mode
+    """
+    f.write(b'{')
+    for i, (key, value) in enumerate(results.items()):
+        f.write(b',\n  ' if i else b'\n  ')
+        f.write(_json_dumps(key) + b': ')
+        if key == 'smart_data' and value:
+            f.write(b'{')
+            for j, (drive, smart_data) in enumerate(value.items()):
+                f.write(b',\n    ' if j else b'\n    ')
+                f.write(_json_dumps(drive) + b': ')
+                f.write(_json_dumps(smart_data).replace(b'\n', b'\n    '))
+            f.write(b'\n  }')
+        else:
+            f.write(_json_dumps(value).replace(b'\n', b'\n  '))
+    f.write(b'\n}\n')
+
+# Linux mount table; polling it signals POLLPRI after any (un)mount
+_MOUNTINFO = '/proc/self/mountinfo'
+_mounts_watch = None
+
+def _mounts_changed():
+    """
+    Report whether the mount table changed since the previous call.
+    
+    Returns:
+        bool: True after a mount or unmount; always False where the mount
+            table can't be watched (non-Linux)
+    """
+    global _mounts_watch
+    if _mounts_watch is None:
+        try:
+            mountinfo = open(_MOUNTINFO)
+            poller = select.poll()
+            poller.register(mountinfo, select.POLLPRI | select.POLLERR)
+            # Keep the file open; the kernel tracks changes per open file
+            _mounts_watch = (mountinfo, poller)
+        except (OSError, AttributeError):
+            _mounts_watch = False
+    
+    if not _mounts_watch:
+        return False
+    return any(events & (select.POLLPRI | select.POLLERR) for _, events in _mounts_watch[1].poll(0))
+
+def _ttl_cache(seconds, stale=None):
+    """
+    Cache a function's results per set of arguments for a number of seconds.
+    
+    Arguments are bound to the function's signature with defaults applied,
+    so f(), f(False) and f(all=False) share one entry.
+    
+    Args:
+        seconds (float): How long a result stays valid
+        stale (callable): Optional check run on every call; when it returns
+            True all cached results are dropped
+        
+    Returns:
+        callable: Decorator; wrapped functions gain a cache_clear() method
+    """
+    def decorator(func):
+        entries = {}
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if stale is not None and stale():
+                entries.clear()
+            
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+            
+            now = time.time()
+            cached = entries.get(key)
+            if cached and now - cached[1] < seconds:
+                return cached[0]
+            
+            value = func(*args, **kwargs)
+            entries[key] = (value, now)
+            return value
+        
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+@_ttl_cache(MOUNTS_TTL_SECONDS, stale=_mounts_changed)
+def _disk_partitions(all=False):
+    """
+    Cached psutil.disk_partitions(), refreshed on mount table changes.
+    
+    Args:
+        all (bool): Include pseudo and duplicate filesystems
+        
+    Returns:
+        list: psutil partition tuples
+    """
+    return psutil.disk_partitions(all)
+
+# Partition names for the common whole-disk naming schemes
+# (nvme0n1p2 / mmcblk0p1 and sda1 / vdb3 / xvda1)
+_PARTITION_RE = re.compile(r'^(/dev/(?:nvme\d+n\d+|mmcblk\d+))p\d+$|^(/dev/(?:[shv]d[a-z]+|xvd[a-z]+))\d+$')
+
+def _smartctl_args(drive_path, device_type=None):
+    """
+    Build the smartctl command line for a drive.
+    
+    Only identity, health and attribute data are requested (-i -H -A), which
+    needs far fewer device round-trips than -a. ATA/SCSI drives in standby
+    are left asleep rather than spun up just to be polled.
+    
+    Args:
+        drive_path (str): System path to drive device
+        device_type (str): smartctl -d device type, if known
+        
+    Returns:
+        list: smartctl argv
+    """
+    args = ['smartctl', '-i', '-H', '-A']
+    if device_type:
+        args += ['-d', device_type]
+    if device_type != 'nvme' and 'nvme' not in drive_path:
+        args += ['-n', 'standby']
+    return args + ['-j', drive_path]
+
+def _parent_disks(partition_device):
+    """
+    Resolve a partition to the whole disk(s) it lives on.
+    
+    Symlinks (/dev/disk/by-*, /dev/mapper/*) are followed, and on Linux
+    device-mapper volumes (LVM, LUKS) are traced through their slaves.
+    Names that aren't device paths (ZFS datasets such as rpool/ROOT,
+    network shares) have no disk to resolve and are skipped.
+    
+    Args:
+        partition_device (str): Partition device path
+        
+    Returns:
+        list: Whole-disk device paths, empty if there are none
+    """
+    if not partition_device.startswith('/'):
+        return []
+    
+    real = os.path.realpath(partition_device)
+    
+    slaves_dir = f"/sys/class/block/{os.path.basename(real)}/slaves"
+    if real.startswith('/dev/') and os.path.isdir(slaves_dir):
+        slaves = os.listdir(slaves_dir)
+        if slaves:
+            disks = []
+            for slave in slaves:
+                for disk in _parent_disks(f"/dev/{slave}"):
+                    if disk not in disks:
+                        disks.append(disk)
+            return disks
+    
+    match = _PARTITION_RE.match(real)
+    if match:
+        return [match.group(1) or match.group(2)]
+    return [real]
+
+def _drive_label(drive_path, device_type=None):
+    """
+    Name a drive for reports and logs.
+    
+    Drives behind a RAID controller share one path (/dev/bus/0) and are
+    told apart by a numbered smartctl device type (megaraid,0, megaraid,1),
+    so such types are made part of the name.
+    
+    Args:
+        drive_path (str): System path to drive device
+        device_type (str): smartctl -d device type, if known
+        
+    Returns:
+        str: The path, followed by ' [device_type]' for numbered types
+    """
+    if device_type and ',' in device_type:
+        return f"{drive_path} [{device_type}]"
+    return drive_path
+
+def _map_partitions(partition_devices, drives):
+    """
+    Group partitions under the physical drives that hold them.
+    
+    Only device paths can be traced to a disk, so this works on Linux and
+    other POSIX systems; Windows drive letters are left unmapped.
+    
+    Args:
+        partition_devices (list): Partition device paths
+        drives (iterable): (drive_path, device_type) pairs, e.g. from
+            smartctl --scan-open
+        
+    Returns:
+        dict: {drive label: [partition_device, ...]} for every drive
+    """
+    drives = list(drives)
+    partitions = {_drive_label(*drive): [] for drive in drives}
+    for partition in partition_devices:
+        for disk in _parent_disks(partition):
+            for drive in drives:
+                # smartctl names NVMe controllers (/dev/nvme0) rather than
+                # namespaces (/dev/nvme0n1)
+                if disk == drive[0] or re.fullmatch(re.escape(drive[0]) + r'n\d+', disk):
+                    partitions[_drive_label(*drive)].append(partition)
+                    break
+    return partitions
+
+# ioprio_set(2) syscall numbers and constants (linux/ioprio.h)
+_IOPRIO_SET_NR = {'x86_64': 251, 'amd64': 251, 'i386': 289, 'i686': 289, 'aarch64': 30, 'arm64': 30}
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_CLASS_SHIFT = 13
+IOPRIO_CLASS_IDLE = 3
+
+def _ioprio_syscall():
+    """
+    Look up libc's syscall() for ioprio_set(2) on this machine.
+    
+    Returns:
+        tuple: (syscall function, syscall number), or None where ioprio_set
+            isn't available (non-Linux or unknown architecture)
+    """
+    nr = _IOPRIO_SET_NR.get(platform.machine().lower())
+    if not sys.platform.startswith('linux') or nr is None:
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syscall, nr
+    except (OSError, AttributeError):
+        return None
+
+_IOPRIO_SYSCALL = _ioprio_syscall()
+
+# Windows children are created at idle priority directly
+_LOW_PRIORITY_KWARGS = {'creationflags': subprocess.IDLE_PRIORITY_CLASS} if os.name == 'nt' else {}
+
+def _lower_priority(pid):
+    """
+    Drop a running child to idle CPU and I/O priority.
+    
+    SMART queries stall the drive's queue no matter what, but at idle
+    priority competing foreground I/O is scheduled ahead of them. This is
+    done from the parent right after spawning, rather than in a preexec_fn,
+    so the child can still be started with vfork/posix_spawn and nothing
+    runs between fork and exec while other threads exist.
+    
+    Args:
+        pid (int): Child process ID
+    """
+    if hasattr(os, 'setpriority'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, pid, 19)
+        except OSError:
+            pass
+    if _IOPRIO_SYSCALL is not None:
+        syscall, nr = _IOPRIO_SYSCALL
+        syscall(nr, _IOPRIO_WHO_PROCESS, pid, IOPRIO_CLASS_IDLE << _IOPRIO_CLASS_SHIFT)
+
+async def _run_command(argv, timeout):
+    """
+    Run a command on the event loop and capture its output.
+    
+    The command runs at idle CPU and I/O priority.
+    
+    Args:
+        argv (list): Command and arguments
+        timeout (float): Seconds to wait before killing the process
+        
+    Returns:
+        subprocess.CompletedProcess: Exit code with decoded stdout/stderr
+        
+    Raises:
+        FileNotFoundError: If the command is not installed
+        subprocess.TimeoutExpired: If the command did not finish in time
+    """
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        **_LOW_PRIORITY_KWARGS
+    )
+    _lower_priority(process.pid)
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(argv, timeout)
+    
+    return subprocess.CompletedProcess(
+        argv, process.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+    )
+
 class SSDHealthMonitor:
     """
     Main monitoring class for SSD/NVMe health assessment.
@@ -26,57 +498,115 @@ class SSDHealthMonitor:
     temperature readings, and SMART data analysis.
     """
     
-    def __init__(self, temp_threshold=70, usage_threshold=90):
+    def __init__(self, temp_threshold=70, usage_threshold=90, read_method="concurrent",
+                 smart_ttl=CACHE_TTL_SECONDS, min_interval=60, full_smart=True,
+                 mail_debounce=MAIL_DEBOUNCE_SECONDS, verbose=False):
         """
         Initialize monitor with configurable thresholds.
         
         Args:
             temp_threshold (int): Temperature warning threshold in Celsius
             usage_threshold (int): Disk usage warning threshold as percentage
+            read_method (str): "concurrent" to query drives in parallel,
+                "sequential" to query them one at a time
+            smart_ttl (float): Seconds to reuse a drive's SMART data before
+                querying it again (0 disables caching)
+            min_interval (float): Seconds a busy drive waits before its SMART
+                poll is retried; doubled each time it is found busy again
+            full_smart (bool): Keep the complete smartctl output in results;
+                when False only the health verdict is parsed and kept
+            mail_debounce (float): Seconds to collect further alerts before
+                sending a queued email
+            verbose (bool): Print progress and per-item status; warnings
+                and the summary are always printed
         """
+        if read_method not in ("concurrent", "sequential"):
+            raise ValueError(f"Unknown read_method: {read_method!r}")
+        
         self.temp_threshold = temp_threshold
         self.usage_threshold = usage_threshold
+        self.read_method = read_method
+        self.verbose = verbose
+        self.smart_ttl = smart_ttl
+        self.min_interval = min_interval
+        self._smart_backoff = {}
+        self._smart_polled = set()
+        self.full_smart = full_smart
+        self._scanned_devices = None
+        self._hwmon_sensors = None
         self.alerts = []
+        self._alerts_lock = threading.Lock()
         
-        print(f"SSD Health Monitor initialized")
-        print(f"Temperature threshold: {temp_threshold}°C")
-        print(f"Usage threshold: {usage_threshold}%")
+        # Email goes out from a background thread, started on first use, so
+        # SMTP round-trips never hold up a health check
+        self.mail_debounce = mail_debounce
+        self._mail_queue = queue.Queue()
+        self._mail_thread = None
+        self._mail_lock = threading.Lock()
+        
+        if verbose:
+            print("SSD Health Monitor initialized")
+            print(f"Temperature threshold: {temp_threshold}°C")
+            print(f"Usage threshold: {usage_threshold}%")
+    
+    def _add_alert(self, alert):
+        """
+        Record an alert; safe to call from worker threads.
+        
+        Args:
+            alert (tuple): (template_id, *args) key into _TEMPLATES
+        """
+        with self._alerts_lock:
+            self.alerts.append(alert)
     
     def get_disk_usage(self):
         """
         Analyze disk usage across all mounted partitions.
         
         Returns:
-            dict: Partition usage statistics including capacity and utilization
+            dict: Partition usage statistics as parallel columns
+                ('device', 'mountpoint', 'total_gb', 'used_gb', 'free_gb',
+                'percent_used'), one entry per accessible partition
         """
-        print("\n🔍 Checking disk usage...")
-        disk_usage = {}
+        if self.verbose:
+            print("\n🔍 Checking disk usage...")
         
-        partitions = psutil.disk_partitions()
-        
-        for partition in partitions:
+        devices, mountpoints, totals, used, free = [], [], [], [], []
+        for partition in _disk_partitions():
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
-                percent_used = (usage.used / usage.total) * 100
-                
-                disk_usage[partition.device] = {
-                    'mountpoint': partition.mountpoint,
-                    'total_gb': round(usage.total / (1024**3), 2),
-                    'used_gb': round(usage.used / (1024**3), 2),
-                    'free_gb': round(usage.free / (1024**3), 2),
-                    'percent_used': round(percent_used, 1)
-                }
-                
-                if percent_used > self.usage_threshold:
-                    alert = f"⚠️  {partition.device} is {percent_used:.1f}% full (threshold: {self.usage_threshold}%)"
-                    self.alerts.append(alert)
-                    print(alert)
-                else:
-                    print(f"✅ {partition.device}: {percent_used:.1f}% used ({usage.free // (1024**3)} GB free)")
-                    
             except PermissionError:
                 print(f"⚠️  Cannot access {partition.device} (permission denied)")
                 continue
+            
+            devices.append(partition.device)
+            mountpoints.append(partition.mountpoint)
+            totals.append(usage.total)
+            used.append(usage.used)
+            free.append(usage.free)
+        
+        # Numeric pass: whole columns at once, no per-partition dicts
+        # Values are non-negative, so int(x + 0.5) rounds to nearest without round()
+        mul = 100.0 / _GIB
+        percent = [u * 100 / t if t else 0.0 for u, t in zip(used, totals)]
+        disk_usage = {
+            'device': devices,
+            'mountpoint': mountpoints,
+            'total_gb': [int(t * mul + 0.5) / 100 for t in totals],
+            'used_gb': [int(u * mul + 0.5) / 100 for u in used],
+            'free_gb': [int(f * mul + 0.5) / 100 for f in free],
+            'percent_used': [int(p * 10 + 0.5) / 10 for p in percent]
+        }
+        
+        # Presentation pass, in partition order
+        for device, percent_used, free_bytes in zip(devices, percent, free):
+            if percent_used > self.usage_threshold:
+                alert = ('disk_usage', device, percent_used, self.usage_threshold)
+                self._add_alert(alert)
+                if self.verbose:
+                    print(_format_alert(alert))
+            elif self.verbose:
+                print(_MSG_PARTITION_OK.format(device, percent_used, free_bytes >> 30))
         
         return disk_usage
     
@@ -88,30 +618,50 @@ class SSDHealthMonitor:
             dict: Temperature readings for detected storage devices
             
         Note:
-            Requires elevated privileges on most systems
+            Requires elevated privileges on most systems. On Linux the drive
+            sensors are located once and then read directly from sysfs;
+            elsewhere psutil is used.
         """
-        print("\n🌡️  Checking drive temperatures...")
+        if self.verbose:
+            print("\n🌡️  Checking drive temperatures...")
         temperatures = {}
         
+        if self._hwmon_sensors is None:
+            self._hwmon_sensors = _discover_hwmon_sensors()
+        
         try:
-            sensors = psutil.sensors_temperatures()
-            
-            if not sensors:
-                print("⚠️  No temperature sensors found or insufficient permissions")
-                return temperatures
+            if self._hwmon_sensors:
+                readings = []
+                for sensor_name, label, input_path in self._hwmon_sensors:
+                    try:
+                        with open(input_path) as f:
+                            readings.append((sensor_name, label, int(f.read()) / 1000))
+                    except (OSError, ValueError):
+                        # Sensor unavailable right now (e.g. drive asleep)
+                        continue
+            else:
+                sensors = psutil.sensors_temperatures()
+                
+                if not sensors:
+                    print("⚠️  No temperature sensors found or insufficient permissions")
+                    return temperatures
+                
+                readings = [
+                    (sensor_name, sensor.label, sensor.current)
+                    for sensor_name, sensor_list in sensors.items() if _DRIVE_RE.search(sensor_name)
+                    for sensor in sensor_list
+                ]
             
-            for sensor_name, sensor_list in sensors.items():
-                if any(keyword in sensor_name.lower() for keyword in ['nvme', 'ssd', 'sata', 'drive']):
-                    for sensor in sensor_list:
-                        temp = sensor.current
-                        temperatures[f"{sensor_name}_{sensor.label}"] = temp
-                        
-                        if temp > self.temp_threshold:
-                            alert = f"🔥 {sensor_name} temperature: {temp}°C (threshold: {self.temp_threshold}°C)"
-                            self.alerts.append(alert)
-                            print(alert)
-                        else:
-                            print(f"✅ {sensor_name}: {temp}°C")
+            for sensor_name, label, temp in readings:
+                temperatures[f"{sensor_name}_{label}"] = temp
+                
+                if temp > self.temp_threshold:
+                    alert = ('temperature', sensor_name, temp, self.temp_threshold)
+                    self._add_alert(alert)
+                    if self.verbose:
+                        print(_format_alert(alert))
+                elif self.verbose:
+                    print(_MSG_SENSOR_OK.format(sensor_name, temp))
         
         except Exception as e:
             print(f"⚠️  Could not read temperature sensors: {e}")
@@ -119,41 +669,208 @@ class SSDHealthMonitor:
         
         return temperatures
     
-    def check_smart_data(self, drive_path):
+    def get_busy_drives(self, drive_paths):
         """
-        Retrieve SMART health data using smartctl.
+        Find drives with heavy foreground I/O.
+        
+        Samples the kernel I/O counters twice, BUSY_SAMPLE_SECONDS apart.
         
         Args:
-            drive_path (str): System path to drive device
+            drive_paths (list): System paths to drive devices
             
         Returns:
-            dict: SMART analysis results
+            set: Drive paths that moved more than BUSY_THRESHOLD_BYTES
         """
-        print(f"\n🔧 Checking SMART data for {drive_path}...")
+        names = {path: os.path.basename(os.path.realpath(path)) for path in drive_paths}
+        if not names:
+            return set()
         
         try:
-            result = subprocess.run(
-                ['smartctl', '-a', '-j', drive_path],
-                capture_output=True,
-                text=True,
-                timeout=30
+            before = psutil.disk_io_counters(perdisk=True) or {}
+            time.sleep(BUSY_SAMPLE_SECONDS)
+            after = psutil.disk_io_counters(perdisk=True) or {}
+        except Exception as e:
+            print(f"⚠️  Could not read disk I/O counters: {e}")
+            return set()
+        
+        busy = set()
+        for path, name in names.items():
+            # An NVMe controller (nvme0) covers its namespaces (nvme0n1, ...)
+            disk_re = re.compile(re.escape(name) + r'(n\d+)?')
+            moved = sum(
+                after[disk].read_bytes + after[disk].write_bytes
+                - before[disk].read_bytes - before[disk].write_bytes
+                for disk in after if disk in before and disk_re.fullmatch(disk)
             )
+            if moved > BUSY_THRESHOLD_BYTES:
+                busy.add(path)
+        
+        return busy
+    
+    def _defer_smart(self, drive_path, busy, device_type=None):
+        """
+        Decide whether a drive's SMART poll should be skipped for now.
+        
+        Only drives already polled successfully by this monitor are ever
+        deferred, so a one-shot run always gets a verdict for every drive.
+        After that, a busy drive is deferred and put on back-off: it is not
+        polled again until its interval (starting at ``min_interval``) has
+        elapsed, and each further busy deferral doubles the interval. Once
+        the interval reaches MAX_BACKOFF_SECONDS the drive is polled even if
+        busy, so a drive under constant load is still checked. A completed
+        poll clears the back-off.
+        
+        Args:
+            drive_path (str): System path to drive device
+            busy (bool): Whether the drive currently has heavy I/O
+            device_type (str): smartctl -d device type, if known
             
-            if result.returncode == 0:
-                smart_data = json.loads(result.stdout)
-                
-                if 'smart_status' in smart_data:
-                    health_status = smart_data['smart_status']['passed']
-                    if health_status:
-                        print(f"✅ {drive_path}: SMART status PASSED")
-                    else:
-                        alert = f"❌ {drive_path}: SMART status FAILED - Drive may be failing!"
-                        self.alerts.append(alert)
-                        print(alert)
-                
+        Returns:
+            bool: True if the poll should be skipped
+        """
+        drive = (drive_path, device_type)
+        if drive not in self._smart_polled:
+            return False
+        
+        now = time.time()
+        backoff = self._smart_backoff.get(drive)
+        if backoff and now < backoff[0]:
+            return True
+        
+        interval = backoff[1] if backoff else self.min_interval
+        if busy and interval < MAX_BACKOFF_SECONDS:
+            interval = min(max(interval, 1) * 2, MAX_BACKOFF_SECONDS) if backoff else interval
+            self._smart_backoff[drive] = (now + interval, interval)
+            return True
+        
+        return False
+    
+    def _cached_smart_data(self, drive_path, full=False, device_type=None):
+        """
+        Return a drive's cached SMART data if still within ``smart_ttl``.
+        
+        Args:
+            drive_path (str): System path to drive device
+            full (bool): Whether the complete smartctl output is wanted
+            device_type (str): smartctl -d device type, if known
+            
+        Returns:
+            dict: Cached SMART data, or None if missing or stale
+        """
+        cached = _cache.get((drive_path, device_type, full))
+        if cached and time.time() - cached[1] < self.smart_ttl:
+            return cached[0]
+        return None
+    
+    def check_smart_data(self, drive_path, busy=False, full=False, device_type=None):
+        """
+        Retrieve SMART health data using smartctl.
+        
+        Synchronous wrapper around check_smart_data_async().
+        
+        Args:
+            drive_path (str): System path to drive device
+            busy (bool): Whether the drive currently has heavy I/O
+            full (bool): Return the complete smartctl output instead of
+                only the health verdict
+            device_type (str): smartctl -d device type, if known
+            
+        Returns:
+            dict: SMART analysis results, or {'deferred': True} if skipped
+        """
+        return asyncio.run(self.check_smart_data_async(drive_path, busy, full, device_type))
+    
+    async def check_smart_data_async(self, drive_path, busy=False, full=False, device_type=None):
+        """
+        Retrieve SMART health data using smartctl.
+        
+        Results are cached for ``smart_ttl`` seconds since each query stalls
+        the drive's I/O queue. Busy or recently polled drives are deferred
+        instead of being queried.
+        
+        Args:
+            drive_path (str): System path to drive device
+            busy (bool): Whether the drive currently has heavy I/O
+            full (bool): Return the complete smartctl output instead of
+                only the health verdict
+            device_type (str): smartctl -d device type, if known
+            
+        Returns:
+            dict: SMART analysis results, {'deferred': True} if skipped, or
+                {'standby': True} if the drive was asleep
+        """
+        label = _drive_label(drive_path, device_type)
+        if self.verbose:
+            print(_MSG_SMART_CHECKING.format(label))
+        
+        smart_data = self._cached_smart_data(drive_path, full, device_type)
+        if smart_data is None:
+            if self._defer_smart(drive_path, busy, device_type):
+                if self.verbose:
+                    print(f"⏸️  {label}: SMART check deferred (drive busy or recently polled)")
+                return {'deferred': True}
+            
+            smart_data = await self._read_smart_data(drive_path, full, device_type)
+            if smart_data:
+                self._smart_backoff.pop((drive_path, device_type), None)
+                if 'standby' not in smart_data:
+                    self._smart_polled.add((drive_path, device_type))
+                    _cache[(drive_path, device_type, full)] = (smart_data, time.time())
+        
+        if 'smart_status' in smart_data:
+            health_status = smart_data['smart_status']['passed']
+            if health_status:
+                if self.verbose:
+                    print(_MSG_SMART_PASSED.format(label))
+            else:
+                alert = ('smart_failed', label)
+                self._add_alert(alert)
+                if self.verbose:
+                    print(_format_alert(alert))
+        
+        return smart_data
+    
+    async def _read_smart_data(self, drive_path, full=False, device_type=None):
+        """
+        Run smartctl against a drive and parse its JSON output.
+        
+        NVMe drives are read with nvme-cli first, falling back to smartctl
+        if nvme-cli is missing or fails.
+        
+        Args:
+            drive_path (str): System path to drive device
+            full (bool): Decode the whole document; otherwise only the
+                health verdict is extracted when present
+            device_type (str): smartctl -d device type, if known
+            
+        Returns:
+            dict: Parsed smartctl output, {'standby': True} if the drive is
+                asleep, empty on failure
+        """
+        if device_type == 'nvme' or 'nvme' in drive_path:
+            smart_data = await self._read_nvme_smart_log(drive_path, full)
+            if smart_data:
                 return smart_data
+        
+        args = _smartctl_args(drive_path, device_type)
+        try:
+            try:
+                result = await _run_command(args, timeout=SMART_TIMEOUT_FAST)
+            except subprocess.TimeoutExpired:
+                result = await _run_command(args, timeout=SMART_TIMEOUT_SLOW)
+            
+            if result.returncode == 2 and _STANDBY_RE.search(result.stdout):
+                if self.verbose:
+                    print(f"💤 {_drive_label(drive_path, device_type)}: in standby, SMART check skipped")
+                return {'standby': True}
+            elif result.returncode == 0:
+                if not full:
+                    match = _PASSED_RE.search(result.stdout)
+                    if match:
+                        return {'smart_status': {'passed': match.group(1) == 'true'}}
+                return _json_loads(result.stdout)
             else:
-                print(f"⚠️  Could not get SMART data for {drive_path}")
+                print(f"⚠️  Could not get SMART data for {_drive_label(drive_path, device_type)}")
                 print("💡 Make sure 'smartctl' is installed and you have admin privileges")
                 
         except FileNotFoundError:
@@ -168,9 +885,75 @@ class SSDHealthMonitor:
         
         return {}
     
+    async def _read_nvme_smart_log(self, drive_path, full=False):
+        """
+        Read an NVMe drive's health log with ``nvme smart-log``.
+        
+        This is a single admin command, unlike smartctl's identify plus
+        log-page reads.
+        
+        Args:
+            drive_path (str): NVMe controller or namespace path
+            full (bool): Include the whole health log, not just the verdict
+            
+        Returns:
+            dict: {'smart_status': {'passed': ...}} plus 'nvme_smart_log'
+                when full, or empty if nvme-cli is unavailable or failed
+        """
+        try:
+            result = await _run_command(['nvme', 'smart-log', '-o', 'json', drive_path],
+                                        timeout=SMART_TIMEOUT_FAST)
+            if result.returncode != 0:
+                return {}
+            smart_log = _json_loads(result.stdout)
+        except (OSError, subprocess.TimeoutExpired, ValueError):
+            return {}
+        
+        # Any critical warning bit (spare, temperature, reliability,
+        # read-only, backup) means the drive is failing
+        critical_warning = smart_log.get('critical_warning', 0)
+        if isinstance(critical_warning, dict):
+            critical_warning = critical_warning.get('value', 0)
+        
+        smart_data = {'smart_status': {'passed': critical_warning == 0}}
+        if full:
+            smart_data['nvme_smart_log'] = smart_log
+        return smart_data
+    
+    async def _scan_devices(self):
+        """
+        Enumerate physical drives with ``smartctl --scan-open``.
+        
+        The scan runs once per health check; later calls reuse its result.
+        
+        Returns:
+            list: {'name': ..., 'type': ...} dicts, empty if the scan failed
+        """
+        if self._scanned_devices is None:
+            self._scanned_devices = []
+            try:
+                result = await _run_command(['smartctl', '--scan-open', '-j'], timeout=30)
+                devices = _json_loads(result.stdout).get('devices', [])
+                self._scanned_devices = [
+                    {'name': device['name'], 'type': device.get('type')}
+                    for device in devices if 'name' in device
+                ]
+            except FileNotFoundError:
+                print("⚠️  'smartctl' command not found")
+            except subprocess.TimeoutExpired:
+                print("⚠️  Drive scan timed out")
+            except Exception as e:
+                print(f"⚠️  Could not scan for drives: {e}")
+        
+        return self._scanned_devices
+    
     def send_email_alert(self, smtp_server, smtp_port, email_user, email_pass, recipient):
         """
-        Send email notification for detected issues.
+        Queue an email notification for detected issues.
+        
+        The email is sent by a background thread ``mail_debounce`` seconds
+        after the first alert of a batch was queued; call
+        flush_email_alerts() to send immediately.
         
         Args:
             smtp_server (str): SMTP server hostname
@@ -183,10 +966,100 @@ class SSDHealthMonitor:
             print("✅ No alerts to send - all systems healthy!")
             return
         
-        print(f"\n📧 Sending email alert to {recipient}...")
+        if self.verbose:
+            print(f"\n📧 Queueing email alert to {recipient}...")
+        with self._alerts_lock:
+            alerts = list(self.alerts)
+        
+        with self._mail_lock:
+            if self._mail_thread is None:
+                self._mail_thread = threading.Thread(
+                    target=self._mail_worker, name="ssd-health-mail", daemon=True
+                )
+                self._mail_thread.start()
+        self._mail_queue.put(((smtp_server, smtp_port, email_user, email_pass, recipient), alerts))
+    
+    def flush_email_alerts(self):
+        """
+        Send any queued email alerts now and wait until they are delivered.
+        """
+        if self._mail_thread is None:
+            return
+        self._mail_queue.put(None)
+        self._mail_queue.join()
+    
+    def _mail_worker(self):
+        """
+        Background thread draining the email queue.
+        
+        Alerts queued within ``mail_debounce`` seconds of the first pending
+        one are coalesced (duplicates dropped) into one email, and the SMTP
+        connection is kept open between sends. The window is measured from
+        the first queued alert, so a steady stream of alerts still gets sent.
+        """
+        server, config, pending = None, None, []
+        first_queued = None
+        elapsed = object()  # marks an expired debounce window, not a queue item
+        
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0, first_queued + self.mail_debounce - time.time())
+            try:
+                item = self._mail_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = elapsed
+            
+            try:
+                if item is elapsed:
+                    server = self._deliver_alerts(server, config, pending)
+                    pending = []
+                    continue
+                
+                if item is None:
+                    if pending:
+                        server = self._deliver_alerts(server, config, pending)
+                        pending = []
+                    server = _close_smtp(server)
+                    continue
+                
+                item_config, alerts = item
+                if item_config != config:
+                    # Different destination: send what we have, then reconnect
+                    if pending:
+                        server = self._deliver_alerts(server, config, pending)
+                        pending = []
+                    server = _close_smtp(server)
+                    config = item_config
+                if not pending:
+                    first_queued = time.time()
+                pending.extend(alert for alert in alerts if alert not in pending)
+            except Exception as e:
+                # Never let one bad batch kill the thread and hang flushes
+                print(f"❌ Failed to send email: {e}")
+                pending = []
+            finally:
+                if item is not elapsed:
+                    self._mail_queue.task_done()
+    
+    def _deliver_alerts(self, server, config, alerts):
+        """
+        Email a batch of alerts, reusing an open SMTP connection if possible.
+        
+        Args:
+            server (smtplib.SMTP): Open connection, or None
+            config (tuple): (smtp_server, smtp_port, email_user, email_pass, recipient)
+            alerts (list): Alert tuples to send
+            
+        Returns:
+            smtplib.SMTP: Connection to reuse next time, or None
+        """
+        smtp_server, smtp_port, email_user, email_pass, recipient = config
+        if self.verbose:
+            print(f"\n📧 Sending email alert to {recipient}...")
         
         try:
-            alert_text = "\n".join(self.alerts)
+            alert_text = "\n".join(_format_alert(alert) for alert in alerts)
             message = MIMEText(f"""
 SSD Health Monitor Alert - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -200,64 +1073,137 @@ Please investigate these issues as soon as possible.
 SSD Health Monitor
             """)
             
-            message['Subject'] = f"SSD Health Alert - {len(self.alerts)} issues detected"
+            message['Subject'] = f"SSD Health Alert - {len(alerts)} issues detected"
             message['From'] = email_user
             message['To'] = recipient
-            
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(email_user, email_pass)
-                server.send_message(message)
-                
-            print("✅ Email alert sent successfully!")
-            
         except Exception as e:
             print(f"❌ Failed to send email: {e}")
+            return server
+        
+        # A kept-alive connection may have been dropped by the server;
+        # reconnect once in that case
+        for attempt in range(2):
+            try:
+                if server is None:
+                    server = smtplib.SMTP(smtp_server, smtp_port)
+                    server.starttls()
+                    server.login(email_user, email_pass)
+                server.send_message(message)
+                if self.verbose:
+                    print("✅ Email alert sent successfully!")
+                return server
+            except smtplib.SMTPServerDisconnected as e:
+                server = _close_smtp(server)
+                error = e
+            except Exception as e:
+                print(f"❌ Failed to send email: {e}")
+                return _close_smtp(server)
+        
+        print(f"❌ Failed to send email: {error}")
+        return None
     
     def run_full_check(self):
         """
         Execute comprehensive health assessment.
         
+        Synchronous wrapper around run_full_check_async().
+        
         Returns:
             dict: Complete monitoring results with metadata
         """
-        print("🏥 Starting SSD Health Check...")
-        print("=" * 50)
+        return asyncio.run(self.run_full_check_async())
+    
+    async def run_full_check_async(self):
+        """
+        Execute comprehensive health assessment.
+        
+        Temperature sensors are read in a worker thread while smartctl
+        processes run, so sensor latency hides behind SMART latency.
+        
+        Returns:
+            dict: Complete monitoring results with metadata
+        """
+        if self.verbose:
+            print("🏥 Starting SSD Health Check...")
+            print("=" * 50)
         
         # Execute monitoring components
+        self._scanned_devices = None
         disk_usage = self.get_disk_usage()
-        temperatures = self.get_drive_temperatures()
-        
-        # SMART data collection with drive path conversion
-        smart_data = {}
-        for device in disk_usage.keys():
-            if device.endswith(':'):
-                # Convert Windows drive letters to device paths
-                device_path = f"/dev/sd{chr(ord('a') + ord(device[0]) - ord('A'))}"
-            else:
-                device_path = device
+        temp_task = asyncio.create_task(asyncio.to_thread(self.get_drive_temperatures))
+        
+        # SMART data is collected once per physical drive, not per partition.
+        # Drives are (path, device_type) pairs: RAID members share a path.
+        scanned = await self._scan_devices()
+        if scanned:
+            drives = list(dict.fromkeys((device['name'], device['type']) for device in scanned))
+            partitions = _map_partitions(disk_usage['device'], drives)
+        else:
+            drives, partitions = [], {}
+            for device in disk_usage['device']:
+                if device.rstrip('\\').endswith(':'):
+                    # Legacy guess; drive letters don't name physical drives
+                    parents = [_WIN_TO_DEV.get(device[0].upper(), device)]
+                else:
+                    parents = _parent_disks(device)
+                for parent in parents:
+                    if parent not in partitions:
+                        drives.append((parent, None))
+                    partitions.setdefault(parent, []).append(device)
+        
+        # Only drives that actually need polling are sampled for activity
+        busy = await asyncio.to_thread(
+            self.get_busy_drives,
+            list(dict.fromkeys(
+                path for path, device_type in drives
+                if self._cached_smart_data(path, self.full_smart, device_type) is None
+            ))
+        )
+        
+        if self.read_method == "concurrent":
+            # smartctl calls are I/O bound and independent, so overlap them
+            limit = asyncio.Semaphore(MAX_SMART_WORKERS)
+            
+            async def check(path, device_type):
+                async with limit:
+                    return await self.check_smart_data_async(path, path in busy, self.full_smart, device_type)
             
-            smart_data[device] = self.check_smart_data(device_path)
+            results = await asyncio.gather(*(check(*drive) for drive in drives))
+            smart_data = {_drive_label(*drive): data for drive, data in zip(drives, results)}
+        else:
+            smart_data = {}
+            for path, device_type in drives:
+                smart_data[_drive_label(path, device_type)] = await self.check_smart_data_async(
+                    path, path in busy, self.full_smart, device_type
+                )
+        
+        temperatures = await temp_task
         
         # Generate summary report
         print("\n" + "=" * 50)
         print("📊 HEALTH CHECK SUMMARY")
         print("=" * 50)
         
+        # A deferred drive has no verdict, so it can't count as healthy
+        deferred = [path for path, data in smart_data.items() if data.get('deferred')]
+        
         if self.alerts:
             print(f"❌ {len(self.alerts)} issues found:")
             for alert in self.alerts:
-                print(f"   {alert}")
-        else:
+                print(f"   {_format_alert(alert)}")
+        if deferred:
+            print(f"⏸️  {len(deferred)} drives not checked (busy): {', '.join(deferred)}")
+        if not self.alerts and not deferred:
             print("✅ All systems healthy!")
         
         return {
             'timestamp': datetime.now().isoformat(),
             'disk_usage': disk_usage,
+            'partitions': partitions,
             'temperatures': temperatures,
             'smart_data': smart_data,
-            'alerts': self.alerts,
-            'healthy': len(self.alerts) == 0
+            'alerts': [_alert_record(alert) for alert in self.alerts],
+            'healthy': not self.alerts and not deferred
         }
 
 def main():
@@ -269,7 +1215,9 @@ def main():
     print("🚀 SSD Health Monitor Starting...")
     
     # Initialize monitor with custom thresholds
-    monitor = SSDHealthMonitor(temp_threshold=75, usage_threshold=85)
+    # Per-item progress is only worth printing to a terminal; the summary
+    # and the JSON log carry everything a log collector needs
+    monitor = SSDHealthMonitor(temp_threshold=75, usage_threshold=85, verbose=sys.stdout.isatty())
     
     # Execute health assessment
     results = monitor.run_full_check()
@@ -285,13 +1233,14 @@ def main():
             email_pass='your-app-password',
             recipient='admin@yourcompany.com'
         )
+        monitor.flush_email_alerts()
     """
     
     # Results logging
     log_filename = f"ssd_health_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     try:
-        with open(log_filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(log_filename, 'wb') as f:
+            _write_results(results, f)
         print(f"📝 Results saved to {log_filename}")
     except Exception as e:
         print(f"⚠️  Could not save log file: {e}")